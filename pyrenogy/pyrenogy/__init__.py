@@ -23,44 +23,111 @@ Features:
 __version__ = "0.1.0"
 __author__ = "PyRenogy Contributors"
 
-from .client import RenogyClient, calculate_crc16, verify_crc
-from .exceptions import (
-    CommunicationError,
-    ConnectionError,
-    CRCError,
-    DeviceNotFoundError,
-    InvalidResponseError,
-    ModbusError,
-    RenogyError,
-    TimeoutError,
-)
-from .models import (
-    BatteryData,
-    ControllerData,
-    DailyStats,
-    DeviceInfo,
-    HistoricalStats,
-    LoadData,
-    RenogyReading,
-    SolarData,
-)
-from .registers import (
-    CHARGING_STATUS,
-    CONTROL_REGISTERS,
-    DAILY_STATS_REGISTERS,
-    DEVICE_INFO_REGISTERS,
-    HISTORICAL_STATS_REGISTERS,
-    RegisterDefinition,
-    RegisterType,
-    SCC_REGISTERS,
-    get_all_device_info_registers,
-    get_all_realtime_registers,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_client import AsyncRenogyClient
+    from .client import RenogyClient, calculate_crc16, verify_crc
+    from .exceptions import (
+        CommunicationError,
+        ConnectionError,
+        CRCError,
+        DeviceNotFoundError,
+        InvalidResponseError,
+        ModbusError,
+        RenogyError,
+        TimeoutError,
+    )
+    from .models import (
+        BatteryData,
+        ControllerData,
+        DailyStats,
+        DeviceInfo,
+        HistoricalStats,
+        LoadData,
+        RenogyReading,
+        SolarData,
+    )
+    from .registers import (
+        CHARGING_STATUS,
+        CONTROL_REGISTERS,
+        DAILY_STATS_REGISTERS,
+        DEVICE_INFO_REGISTERS,
+        HISTORICAL_STATS_REGISTERS,
+        LIVE_AND_STATS_REGISTERS,
+        SCC_REGISTERS,
+        RegisterDefinition,
+        RegisterKind,
+        RegisterType,
+        get_all_device_info_registers,
+        get_all_realtime_registers,
+    )
+
+# Public names resolved lazily on first access (PEP 562) so that
+# ``import pyrenogy`` does not pull in pyserial and every submodule up front.
+_LAZY_IMPORTS = {
+    # Client
+    "AsyncRenogyClient": "async_client",
+    "RenogyClient": "client",
+    "calculate_crc16": "client",
+    "verify_crc": "client",
+    # Exceptions
+    "RenogyError": "exceptions",
+    "CommunicationError": "exceptions",
+    "ConnectionError": "exceptions",
+    "CRCError": "exceptions",
+    "DeviceNotFoundError": "exceptions",
+    "InvalidResponseError": "exceptions",
+    "ModbusError": "exceptions",
+    "TimeoutError": "exceptions",
+    # Models
+    "BatteryData": "models",
+    "ControllerData": "models",
+    "DailyStats": "models",
+    "DeviceInfo": "models",
+    "HistoricalStats": "models",
+    "LoadData": "models",
+    "RenogyReading": "models",
+    "SolarData": "models",
+    # Registers
+    "CHARGING_STATUS": "registers",
+    "CONTROL_REGISTERS": "registers",
+    "DAILY_STATS_REGISTERS": "registers",
+    "DEVICE_INFO_REGISTERS": "registers",
+    "HISTORICAL_STATS_REGISTERS": "registers",
+    "LIVE_AND_STATS_REGISTERS": "registers",
+    "RegisterDefinition": "registers",
+    "RegisterKind": "registers",
+    "RegisterType": "registers",
+    "SCC_REGISTERS": "registers",
+    "get_all_device_info_registers": "registers",
+    "get_all_realtime_registers": "registers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public API, including names not yet imported."""
+    return sorted(__all__)
+
 
 __all__ = [
     # Version
     "__version__",
     # Client
+    "AsyncRenogyClient",
     "RenogyClient",
     "calculate_crc16",
     "verify_crc",
@@ -88,7 +155,9 @@ __all__ = [
     "DAILY_STATS_REGISTERS",
     "DEVICE_INFO_REGISTERS",
     "HISTORICAL_STATS_REGISTERS",
+    "LIVE_AND_STATS_REGISTERS",
     "RegisterDefinition",
+    "RegisterKind",
     "RegisterType",
     "SCC_REGISTERS",
     "get_all_device_info_registers",
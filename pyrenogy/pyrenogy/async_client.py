@@ -0,0 +1,135 @@
+"""Asyncio client for polling several Renogy devices concurrently.
+
+Serial I/O is blocking, so each call runs the synchronous RenogyClient in a
+worker thread. Devices on separate serial ports are then polled in parallel
+with ``asyncio.gather`` while each client still runs one transaction at a time.
+
+The serial port is opened exclusively, so only one client can use a port.
+Several devices sharing one RS-485 bus cannot be polled concurrently; read
+them one after another through a single client, setting ``client.device_id``
+before each call.
+"""
+
+import array
+import asyncio
+import threading
+from collections.abc import Callable, Mapping
+from types import TracebackType
+from typing import Any, TypeVar
+
+from .client import RenogyClient
+from .models import DeviceInfo, RenogyReading
+from .registers import RegisterDefinition
+
+T = TypeVar("T")
+
+
+class AsyncRenogyClient:
+    """Asyncio wrapper around RenogyClient.
+
+    Example:
+        >>> async with AsyncRenogyClient("/dev/ttyUSB0") as a:
+        ...     async with AsyncRenogyClient("/dev/ttyUSB1") as b:
+        ...         first, second = await asyncio.gather(a.read_all(), b.read_all())
+
+    Attributes:
+        client: The underlying synchronous RenogyClient
+    """
+
+    def __init__(
+        self,
+        port: str,
+        device_id: int = 1,
+        baudrate: int = 9600,
+        timeout: float = 1.0,
+    ):
+        """Initialize async Renogy client.
+
+        Args:
+            port: Serial port path (e.g., '/dev/ttyUSB0' or 'COM3')
+            device_id: Modbus slave device ID (default 1)
+            baudrate: Serial communication speed (default 9600)
+            timeout: Read timeout in seconds (default 1.0)
+        """
+        self.client = RenogyClient(port, device_id=device_id, baudrate=baudrate, timeout=timeout)
+        # Modbus RTU is half-duplex: serialize transactions on this client's port.
+        # The asyncio lock queues waiting coroutines; the thread lock is held by the
+        # worker itself, so a cancelled caller cannot let a second transaction start
+        # while the first is still on the wire
+        self._lock = asyncio.Lock()
+        self._io_lock = threading.Lock()
+
+    async def __aenter__(self) -> "AsyncRenogyClient":
+        """Async context manager entry - opens connection."""
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Async context manager exit - closes connection."""
+        await self.disconnect()
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking client call while holding the I/O lock (worker thread)."""
+        with self._io_lock:
+            return func(*args)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking client call in a worker thread, one at a time per client."""
+        async with self._lock:
+            return await asyncio.to_thread(self._call, func, *args)
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if serial connection is open."""
+        return self.client.is_connected
+
+    async def connect(self) -> None:
+        """Open serial connection to device."""
+        await self._run(self.client.connect)
+
+    async def disconnect(self) -> None:
+        """Close serial connection."""
+        await self._run(self.client.disconnect)
+
+    async def read_registers(self, start_address: int, count: int) -> list[int]:
+        """Read holding registers from device."""
+        return await self._run(self.client.read_registers, start_address, count)
+
+    async def read_registers_array(self, start_address: int, count: int) -> array.array:
+        """Read holding registers into a compact ``array.array('H')``."""
+        return await self._run(self.client.read_registers_array, start_address, count)
+
+    async def write_register(self, address: int, value: int) -> None:
+        """Write a single holding register."""
+        await self._run(self.client.write_register, address, value)
+
+    async def read_register_values(
+        self, registers: Mapping[str, RegisterDefinition] | None = None
+    ) -> dict[str, int | float | str]:
+        """Read a group of registers and decode them by name."""
+        return await self._run(self.client.read_register_values, registers)
+
+    async def read_device_info(self) -> DeviceInfo:
+        """Read device identification information."""
+        return await self._run(self.client.read_device_info)
+
+    async def read_realtime_data(self) -> RenogyReading:
+        """Read real-time monitoring data from device."""
+        return await self._run(self.client.read_realtime_data)
+
+    async def read_all(self, include_device_info: bool = True) -> RenogyReading:
+        """Read all available data from device."""
+        return await self._run(self.client.read_all, include_device_info)
+
+    async def set_load(self, on: bool) -> None:
+        """Turn load output on or off."""
+        await self._run(self.client.set_load, on)
+
+    async def get_load_state(self) -> bool:
+        """Get current load switch state."""
+        return await self._run(self.client.get_load_state)
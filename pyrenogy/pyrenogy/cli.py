@@ -4,29 +4,62 @@ This module provides a beautiful CLI using Rich for interacting with
 Renogy solar devices.
 """
 
+from __future__ import annotations
+
+import bisect
+import functools
+import importlib
 import logging
-import sys
-import time
-from typing import Optional
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, cast
 
 import click
-from rich.console import Console
-from rich.live import Live
-from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-from rich.text import Text
-
-from .client import RenogyClient
-from .exceptions import RenogyError
+
 from .models import RenogyReading
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# Rich is imported lazily so that `renogy --help` only pays for click
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+# Color thresholds: SOC cuts are inclusive lower bounds (bisect_right),
+# power cuts are exclusive lower bounds (bisect_left).
+_SOC_CUTS = (20, 50, 80)
+_SOC_STYLES = ("red bold", "orange1", "yellow", "green bold")
+_MONITOR_SOC_STYLES = ("red", "orange1", "yellow", "green")
+_POWER_CUTS = (10, 100)
+_POWER_STYLES = ("dim", "yellow", "green bold")
+_MONITOR_POWER_STYLES = ("dim", "yellow", "green")
+
+
+@functools.lru_cache(maxsize=256)
+def _styled_text(value: str, style: str) -> Text:
+    """Return a cached styled Text cell, skipping Rich's markup parser."""
+    from rich.text import Text
+
+    return Text(value, style=style)
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging with Rich handler."""
+    from rich.logging import RichHandler
+
+    console = get_console()
     level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(
         level=level,
@@ -37,7 +70,11 @@ def setup_logging(verbose: bool = False) -> None:
 
 def create_battery_panel(reading: RenogyReading) -> Panel:
     """Create a Rich panel for battery information."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="cyan")
     table.add_column("Value", style="green")
     table.add_column("Unit", style="dim")
@@ -46,14 +83,7 @@ def create_battery_panel(reading: RenogyReading) -> Panel:
 
     # SOC with color coding
     soc = battery.state_of_charge
-    if soc >= 80:
-        soc_style = "green bold"
-    elif soc >= 50:
-        soc_style = "yellow"
-    elif soc >= 20:
-        soc_style = "orange1"
-    else:
-        soc_style = "red bold"
+    soc_style = _SOC_STYLES[bisect.bisect_right(_SOC_CUTS, soc)]
 
     table.add_row("State of Charge", Text(f"{soc}", style=soc_style), "%")
     table.add_row("Voltage", f"{battery.voltage:.1f}", "V")
@@ -66,7 +96,11 @@ def create_battery_panel(reading: RenogyReading) -> Panel:
 
 def create_solar_panel(reading: RenogyReading) -> Panel:
     """Create a Rich panel for solar panel information."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="cyan")
     table.add_column("Value", style="yellow")
     table.add_column("Unit", style="dim")
@@ -75,12 +109,7 @@ def create_solar_panel(reading: RenogyReading) -> Panel:
 
     # Power with color coding
     power = solar.power
-    if power > 100:
-        power_style = "green bold"
-    elif power > 10:
-        power_style = "yellow"
-    else:
-        power_style = "dim"
+    power_style = _POWER_STYLES[bisect.bisect_left(_POWER_CUTS, power)]
 
     table.add_row("Voltage", f"{solar.voltage:.1f}", "V")
     table.add_row("Current", f"{solar.current:.2f}", "A")
@@ -91,7 +120,11 @@ def create_solar_panel(reading: RenogyReading) -> Panel:
 
 def create_load_panel(reading: RenogyReading) -> Panel:
     """Create a Rich panel for load information."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="cyan")
     table.add_column("Value", style="magenta")
     table.add_column("Unit", style="dim")
@@ -110,7 +143,10 @@ def create_load_panel(reading: RenogyReading) -> Panel:
 
 def create_controller_panel(reading: RenogyReading) -> Panel:
     """Create a Rich panel for controller information."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="cyan")
     table.add_column("Value", style="white")
     table.add_column("Unit", style="dim")
@@ -125,7 +161,10 @@ def create_controller_panel(reading: RenogyReading) -> Panel:
 
 def create_device_info_panel(reading: RenogyReading) -> Panel:
     """Create a Rich panel for device information."""
-    table = Table(show_header=False, box=None, padding=(0, 2))
+    from rich.panel import Panel
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("Label", style="cyan")
     table.add_column("Value", style="green")
 
@@ -139,49 +178,15 @@ def create_device_info_panel(reading: RenogyReading) -> Panel:
     return Panel(table, title="[bold cyan]Device Information[/bold cyan]", border_style="cyan")
 
 
-def create_summary_table(reading: RenogyReading) -> Table:
-    """Create a summary table with all readings."""
-    table = Table(title=f"Renogy Reading - {reading.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-
-    table.add_column("Category", style="cyan", no_wrap=True)
-    table.add_column("Parameter", style="white")
-    table.add_column("Value", justify="right", style="green")
-    table.add_column("Unit", style="dim")
-
-    # Battery section
-    table.add_row("Battery", "State of Charge", str(reading.battery.state_of_charge), "%")
-    table.add_row("", "Voltage", f"{reading.battery.voltage:.1f}", "V")
-    table.add_row("", "Current", f"{reading.battery.current:.2f}", "A")
-    table.add_row("", "Temperature", str(reading.battery.temperature), "°C")
-
-    table.add_section()
-
-    # Solar section
-    table.add_row("Solar", "Voltage", f"{reading.solar.voltage:.1f}", "V")
-    table.add_row("", "Current", f"{reading.solar.current:.2f}", "A")
-    table.add_row("", "Power", str(reading.solar.power), "W")
-
-    table.add_section()
-
-    # Load section
-    load_status = "ON" if reading.load.is_on else "OFF"
-    table.add_row("Load", "Status", load_status, "")
-    table.add_row("", "Voltage", f"{reading.load.voltage:.1f}", "V")
-    table.add_row("", "Current", f"{reading.load.current:.2f}", "A")
-    table.add_row("", "Power", str(reading.load.power), "W")
-
-    table.add_section()
+# Number of readings kept on screen by the monitor command
+MONITOR_HISTORY_ROWS = 20
 
-    # Controller section
-    table.add_row("Controller", "Temperature", str(reading.controller.temperature), "°C")
-    table.add_row("", "Status", reading.controller.charging_status_text, "")
-
-    return table
 
+def init_monitor_table() -> Table:
+    """Create the compact monitoring table with its columns and no rows."""
+    from rich.table import Table
 
-def create_monitor_display(reading: RenogyReading) -> Table:
-    """Create a compact display for monitoring mode."""
-    table = Table(show_header=True, header_style="bold")
+    table = Table(show_header=True, header_style="bold", box=None, padding=(0, 1), show_edge=False)
 
     table.add_column("Time", style="dim", width=8)
     table.add_column("SOC", justify="right", width=5)
@@ -191,42 +196,64 @@ def create_monitor_display(reading: RenogyReading) -> Table:
     table.add_column("Load W", justify="right", width=7)
     table.add_column("Ctrl °C", justify="right", width=7)
 
+    return table
+
+
+def format_monitor_row(reading: RenogyReading) -> tuple[str | Text, ...]:
+    """Format one reading as a row of monitor table cells."""
     time_str = reading.timestamp.strftime("%H:%M:%S")
 
     # Color code SOC
     soc = reading.battery.state_of_charge
-    if soc >= 80:
-        soc_str = f"[green]{soc}%[/green]"
-    elif soc >= 50:
-        soc_str = f"[yellow]{soc}%[/yellow]"
-    elif soc >= 20:
-        soc_str = f"[orange1]{soc}%[/orange1]"
-    else:
-        soc_str = f"[red]{soc}%[/red]"
+    soc_color = _MONITOR_SOC_STYLES[bisect.bisect_right(_SOC_CUTS, soc)]
+    soc_text = _styled_text(f"{soc}%", soc_color)
 
     # Color code solar power
     solar_w = reading.solar.power
-    if solar_w > 100:
-        solar_str = f"[green]{solar_w}[/green]"
-    elif solar_w > 10:
-        solar_str = f"[yellow]{solar_w}[/yellow]"
-    else:
-        solar_str = f"[dim]{solar_w}[/dim]"
-
-    table.add_row(
+    solar_color = _MONITOR_POWER_STYLES[bisect.bisect_left(_POWER_CUTS, solar_w)]
+    solar_text = _styled_text(str(solar_w), solar_color)
+
+    return (
         time_str,
-        soc_str,
+        soc_text,
         f"{reading.battery.voltage:.1f}V",
         f"{reading.battery.current:.2f}A",
-        solar_str,
+        solar_text,
         str(reading.load.power),
         str(reading.controller.temperature),
     )
 
+
+def build_monitor_table(rows: Iterable[tuple[str | Text, ...]]) -> Table:
+    """Build the monitor table from already formatted rows (oldest first)."""
+    table = init_monitor_table()
+    for row in rows:
+        table.add_row(*row)
     return table
 
 
-@click.group()
+# Subcommand names, each implemented by pyrenogy.cli_cmds.<name>
+SUBCOMMANDS = ("info", "load", "monitor", "read", "scan")
+
+
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand module only when it is needed."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:  # noqa: ARG002
+        """List subcommand names without importing their modules."""
+        return list(SUBCOMMANDS)
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str  # noqa: ARG002
+    ) -> click.Command | None:
+        """Import and return the subcommand, or None if it does not exist."""
+        if cmd_name not in SUBCOMMANDS:
+            return None
+        module = importlib.import_module(f".cli_cmds.{cmd_name}", __package__)
+        return cast(click.Command, getattr(module, cmd_name))
+
+
+@click.group(cls=LazyGroup, context_settings={"max_content_width": 100})
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
 @click.version_option(version="0.1.0", prog_name="renogy")
 def cli(verbose: bool):
@@ -234,219 +261,6 @@ def cli(verbose: bool):
     setup_logging(verbose)
 
 
-@cli.command()
-@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
-@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
-@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
-@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
-def read(port: str, device_id: int, baudrate: int, output_json: bool):
-    """Read current data from the device."""
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Connecting to device...", total=None)
-
-            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
-                reading = client.read_all()
-
-        if output_json:
-            import json
-
-            console.print_json(json.dumps(reading.to_dict(), indent=2))
-        else:
-            console.print()
-            console.print(create_device_info_panel(reading))
-            console.print()
-
-            # Create a grid layout
-            from rich.columns import Columns
-
-            panels = [
-                create_battery_panel(reading),
-                create_solar_panel(reading),
-            ]
-            console.print(Columns(panels, equal=True, expand=True))
-
-            panels = [
-                create_load_panel(reading),
-                create_controller_panel(reading),
-            ]
-            console.print(Columns(panels, equal=True, expand=True))
-
-    except RenogyError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted[/yellow]")
-        sys.exit(0)
-
-
-@cli.command()
-@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
-@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
-@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
-@click.option("-i", "--interval", default=5, help="Update interval in seconds (default: 5)")
-@click.option("-c", "--count", default=0, help="Number of readings (0 = unlimited)")
-def monitor(port: str, device_id: int, baudrate: int, interval: int, count: int):
-    """Continuously monitor device data."""
-    try:
-        with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
-            console.print(f"[green]Connected to {port}[/green]")
-            console.print(f"Monitoring every {interval} seconds. Press Ctrl+C to stop.\n")
-
-            # Read device info once
-            client.read_device_info()
-
-            readings_taken = 0
-
-            with Live(console=console, refresh_per_second=1) as live:
-                while count == 0 or readings_taken < count:
-                    try:
-                        reading = client.read_realtime_data()
-                        reading.device_info = client._device_info
-
-                        # Create display
-                        from rich.layout import Layout
-
-                        layout = Layout()
-                        layout.split_column(
-                            Layout(create_device_info_panel(reading), size=6),
-                            Layout(name="main"),
-                        )
-                        layout["main"].split_row(
-                            Layout(create_battery_panel(reading)),
-                            Layout(create_solar_panel(reading)),
-                        )
-
-                        # Alternative: use summary table
-                        live.update(create_summary_table(reading))
-
-                        readings_taken += 1
-                        time.sleep(interval)
-
-                    except RenogyError as e:
-                        console.print(f"[red]Read error:[/red] {e}")
-                        time.sleep(interval)
-
-    except RenogyError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Monitoring stopped[/yellow]")
-        sys.exit(0)
-
-
-@cli.command()
-@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
-@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
-@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
-def info(port: str, device_id: int, baudrate: int):
-    """Show device information."""
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Reading device information...", total=None)
-
-            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
-                device_info = client.read_device_info()
-
-        console.print()
-        table = Table(title="Device Information", show_header=False)
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
-
-        table.add_row("Model", device_info.model or "Unknown")
-        table.add_row("Serial Number", device_info.serial_number or "Unknown")
-        table.add_row("Hardware Version", device_info.hardware_version or "Unknown")
-        table.add_row("Software Version", device_info.software_version or "Unknown")
-        table.add_row("Port", port)
-        table.add_row("Device ID", str(device_id))
-        table.add_row("Baudrate", str(baudrate))
-
-        console.print(table)
-
-    except RenogyError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
-@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
-@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
-@click.option("--on/--off", required=True, help="Turn load on or off")
-def load(port: str, device_id: int, baudrate: int, on: bool):
-    """Control the load output switch."""
-    action = "ON" if on else "OFF"
-
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task(f"Switching load {action}...", total=None)
-
-            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
-                client.set_load(on)
-
-                # Verify the change
-                time.sleep(0.5)
-                current_state = client.get_load_state()
-
-        if current_state == on:
-            console.print(f"[green]Load successfully switched {action}[/green]")
-        else:
-            console.print(f"[yellow]Warning: Load state may not have changed[/yellow]")
-
-    except RenogyError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
-
-@cli.command()
-@click.option("-p", "--port", help="Serial port to scan (optional)")
-def scan(port: Optional[str]):
-    """Scan for Renogy devices on serial ports."""
-    import serial.tools.list_ports
-
-    console.print("[cyan]Scanning for serial ports...[/cyan]\n")
-
-    ports = list(serial.tools.list_ports.comports())
-
-    if not ports:
-        console.print("[yellow]No serial ports found[/yellow]")
-        return
-
-    table = Table(title="Available Serial Ports")
-    table.add_column("Port", style="cyan")
-    table.add_column("Description", style="white")
-    table.add_column("Hardware ID", style="dim")
-
-    for p in ports:
-        table.add_row(p.device, p.description, p.hwid)
-
-    console.print(table)
-
-    if port:
-        console.print(f"\n[cyan]Attempting to connect to {port}...[/cyan]")
-        try:
-            with RenogyClient(port, timeout=2.0) as client:
-                info = client.read_device_info()
-                console.print(f"[green]Found device: {info.model} (S/N: {info.serial_number})[/green]")
-        except RenogyError as e:
-            console.print(f"[red]Failed to connect: {e}[/red]")
-
-
 def main():
     """Main entry point for CLI."""
     cli()
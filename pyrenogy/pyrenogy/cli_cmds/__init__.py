@@ -0,0 +1,5 @@
+"""Subcommands for the ``renogy`` CLI.
+
+Each module defines one click command named after the module. They are
+imported by ``pyrenogy.cli.LazyGroup`` only when that command is used.
+"""
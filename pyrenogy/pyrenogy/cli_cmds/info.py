@@ -0,0 +1,52 @@
+"""The ``renogy info`` command."""
+
+import sys
+
+import click
+
+from ..cli import get_console
+from ..client import RenogyClient
+from ..exceptions import RenogyError
+
+
+@click.command()
+@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
+@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
+@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
+def info(port: str, device_id: int, baudrate: int):
+    """Show device information."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    console = get_console()
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        ) as progress:
+            progress.add_task("Reading device information...", total=None)
+
+            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
+                device_info = client.read_device_info()
+
+        console.print()
+        table = Table(title="Device Information", show_header=False)
+        table.add_column("Property", style="cyan")
+        table.add_column("Value", style="green")
+
+        table.add_row("Model", device_info.model or "Unknown")
+        table.add_row("Serial Number", device_info.serial_number or "Unknown")
+        table.add_row("Hardware Version", device_info.hardware_version or "Unknown")
+        table.add_row("Software Version", device_info.software_version or "Unknown")
+        table.add_row("Port", port)
+        table.add_row("Device ID", str(device_id))
+        table.add_row("Baudrate", str(baudrate))
+
+        console.print(table)
+
+    except RenogyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
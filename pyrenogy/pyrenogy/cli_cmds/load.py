@@ -0,0 +1,58 @@
+"""The ``renogy load`` command."""
+
+import sys
+import time
+
+import click
+
+from ..cli import get_console
+from ..client import RenogyClient
+from ..exceptions import RenogyError
+
+# Seconds to wait for the load switch to report its new state
+LOAD_VERIFY_TIMEOUT = 1.0
+
+
+@click.command()
+@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
+@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
+@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
+@click.option("--on/--off", required=True, help="Turn load on or off")
+def load(port: str, device_id: int, baudrate: int, on: bool):
+    """Control the load output switch."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = get_console()
+
+    action = "ON" if on else "OFF"
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        ) as progress:
+            progress.add_task(f"Switching load {action}...", total=None)
+
+            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
+                client.set_load(on)
+
+                # Verify the change, polling with backoff instead of a fixed pad
+                deadline = time.monotonic() + LOAD_VERIFY_TIMEOUT
+                delay = 0.02
+                while True:
+                    current_state = client.get_load_state()
+                    if current_state == on or time.monotonic() >= deadline:
+                        break
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.2)
+
+        if current_state == on:
+            console.print(f"[green]Load successfully switched {action}[/green]")
+        else:
+            console.print("[yellow]Warning: Load state may not have changed[/yellow]")
+
+    except RenogyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
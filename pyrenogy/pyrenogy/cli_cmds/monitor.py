@@ -0,0 +1,77 @@
+"""The ``renogy monitor`` command."""
+
+import sys
+import time
+from collections import deque
+
+import click
+
+from ..cli import (
+    MONITOR_HISTORY_ROWS,
+    build_monitor_table,
+    create_device_info_panel,
+    format_monitor_row,
+    get_console,
+)
+from ..client import RenogyClient
+from ..exceptions import RenogyError
+from ..models import RenogyReading
+
+
+@click.command()
+@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
+@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
+@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
+@click.option("-i", "--interval", default=5, help="Update interval in seconds (default: 5)")
+@click.option("-c", "--count", default=0, help="Number of readings (0 = unlimited)")
+def monitor(port: str, device_id: int, baudrate: int, interval: int, count: int):
+    """Continuously monitor device data."""
+    from rich.console import Group
+    from rich.live import Live
+
+    console = get_console()
+
+    try:
+        with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
+            console.print(f"[green]Connected to {port}[/green]")
+            console.print(f"Monitoring every {interval} seconds. Press Ctrl+C to stop.\n")
+
+            # Read device info once; its panel never changes, so build it once too
+            device_info = client.read_device_info()
+            device_panel = create_device_info_panel(RenogyReading(device_info=device_info))
+
+            readings_taken = 0
+            # Only the latest rows stay on screen; the table is rebuilt from them
+            rows: deque = deque(maxlen=MONITOR_HISTORY_ROWS)
+
+            # Sleep until a monotonic deadline so read time doesn't stretch the interval
+            next_tick = time.monotonic()
+
+            with Live(console=console, refresh_per_second=1) as live:
+                while count == 0 or readings_taken < count:
+                    try:
+                        reading = client.read_realtime_data()
+                        reading.device_info = device_info
+
+                        rows.append(format_monitor_row(reading))
+                        live.update(Group(device_panel, build_monitor_table(rows)))
+
+                        readings_taken += 1
+
+                    except RenogyError as e:
+                        console.print(f"[red]Read error:[/red] {e}")
+
+                    next_tick += interval
+                    delay = next_tick - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind; restart the cadence instead of bursting reads
+                        next_tick = time.monotonic()
+
+    except RenogyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Monitoring stopped[/yellow]")
+        sys.exit(0)
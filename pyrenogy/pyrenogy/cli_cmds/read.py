@@ -0,0 +1,77 @@
+"""The ``renogy read`` command."""
+
+import json
+import sys
+
+import click
+
+from ..cli import (
+    create_battery_panel,
+    create_controller_panel,
+    create_device_info_panel,
+    create_load_panel,
+    create_solar_panel,
+    get_console,
+)
+from ..client import RenogyClient
+from ..exceptions import RenogyError
+
+
+@click.command()
+@click.option("-p", "--port", required=True, help="Serial port (e.g., COM3 or /dev/ttyUSB0)")
+@click.option("-d", "--device-id", default=1, help="Modbus device ID (default: 1)")
+@click.option("-b", "--baudrate", default=9600, help="Baudrate (default: 9600)")
+@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
+def read(port: str, device_id: int, baudrate: int, output_json: bool):
+    """Read current data from the device."""
+    from rich.columns import Columns
+    from rich.console import Group
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = get_console()
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        ) as progress:
+            progress.add_task("Connecting to device...", total=None)
+
+            with RenogyClient(port, device_id=device_id, baudrate=baudrate) as client:
+                reading = client.read_all()
+
+        if output_json:
+            if console.is_terminal:
+                # Hand Rich the dict so it serializes once for highlighting
+                console.print_json(data=reading.to_dict(), indent=2)
+            else:
+                # Piped output: skip Rich's highlighting pass entirely
+                click.echo(json.dumps(reading.to_dict(), indent=2))
+        else:
+            # Render everything in a single print: one layout pass, one write
+            console.print(
+                Group(
+                    "",
+                    create_device_info_panel(reading),
+                    "",
+                    Columns(
+                        [create_battery_panel(reading), create_solar_panel(reading)],
+                        equal=True,
+                        expand=True,
+                    ),
+                    Columns(
+                        [create_load_panel(reading), create_controller_panel(reading)],
+                        equal=True,
+                        expand=True,
+                    ),
+                )
+            )
+
+    except RenogyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted[/yellow]")
+        sys.exit(0)
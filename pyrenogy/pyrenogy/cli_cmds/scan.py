@@ -0,0 +1,46 @@
+"""The ``renogy scan`` command."""
+
+from typing import Optional
+
+import click
+
+from ..cli import get_console
+from ..client import RenogyClient
+from ..exceptions import RenogyError
+
+
+@click.command()
+@click.option("-p", "--port", help="Serial port to scan (optional)")
+def scan(port: Optional[str]):
+    """Scan for Renogy devices on serial ports."""
+    console = get_console()
+
+    # A known port needs no enumeration, which can take seconds on Windows (WMI)
+    if port:
+        console.print(f"[cyan]Attempting to connect to {port}...[/cyan]")
+        try:
+            with RenogyClient(port, timeout=2.0) as client:
+                info = client.read_device_info()
+                console.print(f"[green]Found device: {info.model} (S/N: {info.serial_number})[/green]")
+        except RenogyError as e:
+            console.print(f"[red]Failed to connect: {e}[/red]")
+        return
+
+    import serial.tools.list_ports
+    from rich.table import Table
+
+    console.print("[cyan]Scanning for serial ports...[/cyan]\n")
+
+    table = Table(title="Available Serial Ports")
+    table.add_column("Port", style="cyan")
+    table.add_column("Description", style="white")
+    table.add_column("Hardware ID", style="dim")
+
+    for p in serial.tools.list_ports.comports():
+        table.add_row(p.device, p.description, p.hwid)
+
+    if not table.rows:
+        console.print("[yellow]No serial ports found[/yellow]")
+        return
+
+    console.print(table)
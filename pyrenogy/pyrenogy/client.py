@@ -7,9 +7,13 @@ Reverse engineered from Renogy DC Home App v1.10.69
 CRC algorithm source: ModBusUtils.java:917-941 method u(byte[] bytes)
 """
 
+import array
+import functools
 import logging
 import struct
+import sys
 import time
+from collections.abc import Mapping
 from typing import Optional
 
 import serial
@@ -31,14 +35,41 @@ from .models import (
     RenogyReading,
     SolarData,
 )
+from .registers import (
+    DEVICE_INFO_BLOCKS,
+    DEVICE_INFO_REGISTERS,
+    LIVE_AND_STATS_READ_PLAN,
+    RegisterDefinition,
+    build_read_plan,
+    decode_ascii,
+    decode_registers,
+    decode_version,
+)
 
 logger = logging.getLogger(__name__)
 
+# Modbus RTU frames must be separated by 3.5 character times of bus silence;
+# an RTU character is 11 bits (start, 8 data, parity or second stop, stop)
+_FRAME_GAP_BITS = 3.5 * 11
+
+# Exception replies: device ID, function code | 0x80, exception code, CRC
+_EXCEPTION_FRAME_LENGTH = 5
+
+# Precompiled frame layouts: request (device ID, function, address, count/value)
+# and trailing CRC (little-endian)
+_REQUEST_STRUCT = struct.Struct(">BBHH")
+_CRC_STRUCT = struct.Struct("<H")
+
+# Realtime block 0x0100-0x010A: SOC, battery V/A, then register 0x0103 split into
+# signed controller and battery temperature bytes, then load V/A/W, solar V/A/W and
+# the load switch state
+_REALTIME_STRUCT = struct.Struct(">HHHbbHHHHHHH")
+
 
 # CRC-16/MODBUS lookup table (precomputed for polynomial 0xA001)
 # Source: ModBusUtils.java:917-941 uses polynomial 40961 (0xA001) with init 0xFFFF
 # The app uses bitwise calculation; this is an equivalent lookup table for speed
-CRC_TABLE = [
+CRC_TABLE = (
     0x0000, 0xC0C1, 0xC181, 0x0140, 0xC301, 0x03C0, 0x0280, 0xC241,
     0xC601, 0x06C0, 0x0780, 0xC741, 0x0500, 0xC5C1, 0xC481, 0x0440,
     0xCC01, 0x0CC0, 0x0D80, 0xCD41, 0x0F00, 0xCFC1, 0xCE81, 0x0E40,
@@ -71,39 +102,51 @@ CRC_TABLE = [
     0x4E00, 0x8EC1, 0x8F81, 0x4F40, 0x8D01, 0x4DC0, 0x4C80, 0x8C41,
     0x4400, 0x84C1, 0x8581, 0x4540, 0x8701, 0x47C0, 0x4680, 0x8641,
     0x8201, 0x42C0, 0x4380, 0x8341, 0x4100, 0x81C1, 0x8081, 0x4040,
-]
+)
 
 
-def calculate_crc16(data: bytes) -> int:
+def calculate_crc16(data: bytes | bytearray | memoryview) -> int:
     """Calculate CRC-16/MODBUS checksum.
 
+    Uses the reflected (0xA001) table form, so there is no per-byte bit
+    reversal or inner bit loop.
+
     Args:
-        data: Bytes to calculate CRC for
+        data: Bytes (or any byte buffer, e.g. a memoryview slice) to calculate CRC for
 
     Returns:
         16-bit CRC value
     """
+    table = CRC_TABLE
     crc = 0xFFFF
     for byte in data:
-        crc = (crc >> 8) ^ CRC_TABLE[(crc ^ byte) & 0xFF]
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
     return crc
 
 
 def verify_crc(data: bytes) -> bool:
     """Verify CRC-16/MODBUS checksum of received data.
 
+    Running the CRC over a message followed by its own little-endian CRC
+    always yields zero, so the whole frame is checked in one pass.
+
     Args:
         data: Complete message including CRC bytes
 
     Returns:
         True if CRC is valid
     """
-    if len(data) < 3:
-        return False
-    message = data[:-2]
-    received_crc = struct.unpack("<H", data[-2:])[0]
-    calculated_crc = calculate_crc16(message)
-    return received_crc == calculated_crc
+    return len(data) >= 3 and calculate_crc16(data) == 0
+
+
+@functools.lru_cache(maxsize=64)
+def _build_frame(device_id: int, function_code: int, address: int, value: int) -> bytes:
+    """Build an 8-byte Modbus RTU request frame, memoized for repeated polls."""
+    frame = bytearray(8)
+    _REQUEST_STRUCT.pack_into(frame, 0, device_id, function_code, address, value)
+    crc = calculate_crc16(memoryview(frame)[:6])
+    _CRC_STRUCT.pack_into(frame, 6, crc)
+    return bytes(frame)
 
 
 class RenogyClient:
@@ -146,11 +189,15 @@ class RenogyClient:
             timeout: Read timeout in seconds (default 1.0)
         """
         self.port = port
-        self.device_id = device_id
         self.baudrate = baudrate
         self.timeout = timeout
         self._serial: Optional[serial.Serial] = None
         self._device_info: Optional[DeviceInfo] = None
+        self.device_id = device_id
+        # Discard stale input before the next request (set after any failed exchange)
+        self._flush_input = True
+        # Monotonic time the last response ended, for the inter-frame silence
+        self._last_rx = 0.0
 
     def __enter__(self) -> "RenogyClient":
         """Context manager entry - opens connection."""
@@ -176,10 +223,19 @@ class RenogyClient:
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout,
+                exclusive=True,
             )
             logger.info(f"Connected to {self.port} at {self.baudrate} baud")
         except serial.SerialException as e:
             raise DeviceNotFoundError(f"Cannot open port {self.port}: {e}") from e
+        self._flush_input = True
+
+        # Skip the tty layer's receive batching delay where supported (Linux);
+        # USB adapters and other platforms may refuse, which is harmless
+        try:
+            self._serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            logger.debug(f"Low latency mode not enabled on {self.port}: {e}")
 
     def disconnect(self) -> None:
         """Close serial connection."""
@@ -188,6 +244,17 @@ class RenogyClient:
             logger.info(f"Disconnected from {self.port}")
         self._serial = None
 
+    @property
+    def device_id(self) -> int:
+        """Modbus slave device ID that requests are addressed to."""
+        return self._device_id
+
+    @device_id.setter
+    def device_id(self, value: int) -> None:
+        # Cached device info belongs to the previous device
+        self._device_id = value
+        self._device_info = None
+
     @property
     def is_connected(self) -> bool:
         """Check if serial connection is open."""
@@ -196,33 +263,32 @@ class RenogyClient:
     def _build_request(self, function_code: int, start_address: int, count: int) -> bytes:
         """Build a Modbus RTU request frame.
 
+        Read and single-register write requests share the same 8-byte layout,
+        so this also builds write frames with ``count`` carrying the value.
+
         Args:
             function_code: Modbus function code
             start_address: Starting register address
-            count: Number of registers to read
+            count: Number of registers to read (or value to write)
 
         Returns:
             Complete request frame with CRC
         """
-        frame = struct.pack(
-            ">BBHH",
-            self.device_id,
-            function_code,
-            start_address,
-            count,
-        )
-        crc = calculate_crc16(frame)
-        frame += struct.pack("<H", crc)
-        return frame
-
-    def _send_request(self, request: bytes) -> bytes:
+        return _build_frame(self.device_id, function_code, start_address, count)
+
+    def _send_request(self, request: bytes, response_length: int) -> bytes:
         """Send request and receive response.
 
+        Modbus RTU response lengths are fixed by the request, so the frame is
+        fetched with two sized reads: the 5-byte head, then the remainder
+        unless the head is an exception reply.
+
         Args:
             request: Complete Modbus request frame
+            response_length: Length of a normal (non-exception) response, including CRC
 
         Returns:
-            Response data (without device ID, function code, or CRC)
+            Complete response frame, CRC-verified
 
         Raises:
             CommunicationError: If not connected
@@ -233,49 +299,73 @@ class RenogyClient:
         if not self.is_connected:
             raise CommunicationError("Not connected to device")
 
-        # Clear any pending data
-        self._serial.reset_input_buffer()
+        # Only a failed exchange can leave late bytes behind; a clean one drains the frame
+        if self._flush_input:
+            self._serial.reset_input_buffer()
+        self._flush_input = True
 
-        # Send request
-        self._serial.write(request)
-        logger.debug(f"TX: {request.hex()}")
+        # Hex dumps are only built when debug logging is actually on
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        # Small delay for device processing
-        time.sleep(0.05)
+        # Leave the RTU inter-frame silence after the previous response
+        wait = self._last_rx + _FRAME_GAP_BITS / self.baudrate - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
 
-        # Read response header (device ID + function code + byte count)
-        header = self._serial.read(3)
-        if len(header) < 3:
-            raise TimeoutError("No response from device")
-
-        device_id, function_code, byte_count = struct.unpack("BBB", header)
-
-        # Check for Modbus exception
-        if function_code & 0x80:
-            # Exception response - byte_count is actually exception code
-            exception_code = byte_count
-            # Read CRC
-            crc_bytes = self._serial.read(2)
+        # Send request
+        self._serial.write(request)
+        if debug:
+            logger.debug(f"TX: {request.hex()}")
+
+        # pyserial blocks until the requested bytes arrive or the timeout expires.
+        # Read the 5 bytes every reply starts with first, so a 5-byte exception
+        # reply returns at once instead of waiting out the timeout for the rest
+        response = self._serial.read(_EXCEPTION_FRAME_LENGTH)
+        if len(response) == _EXCEPTION_FRAME_LENGTH and not response[1] & 0x80:
+            response += self._serial.read(response_length - _EXCEPTION_FRAME_LENGTH)
+        self._last_rx = time.monotonic()
+        if debug:
+            logger.debug(f"RX: {response.hex()}")
+
+        # Hot path: a complete frame with a valid CRC
+        if len(response) == response_length and verify_crc(response):
+            self._flush_input = False
+            return response
+
+        # Exception response: device ID, function code | 0x80, exception code, CRC
+        if len(response) == _EXCEPTION_FRAME_LENGTH and response[1] & 0x80:
+            if not verify_crc(response):
+                raise CRCError("Exception response CRC validation failed")
+            exception_code = response[2]
             raise ModbusError(
                 get_modbus_exception_message(exception_code),
-                function_code=function_code & 0x7F,
+                function_code=response[1] & 0x7F,
                 exception_code=exception_code,
             )
 
-        # Read data + CRC
-        remaining = self._serial.read(byte_count + 2)
-        if len(remaining) < byte_count + 2:
+        if not response:
+            raise TimeoutError("No response from device")
+        if len(response) < response_length:
             raise TimeoutError("Incomplete response from device")
+        raise CRCError("Response CRC validation failed")
 
-        response = header + remaining
-        logger.debug(f"RX: {response.hex()}")
+    def _read_register_bytes(self, start_address: int, count: int) -> bytes:
+        """Read holding registers and return their raw big-endian data bytes.
+
+        Raises:
+            InvalidResponseError: If the byte count does not match the request
+            Various exceptions from _send_request
+        """
+        request = self._build_request(self.READ_HOLDING_REGISTERS, start_address, count)
+        # Device ID + function code + byte count + 2 bytes per register + CRC
+        response = self._send_request(request, 5 + 2 * count)
 
-        # Verify CRC
-        if not verify_crc(response):
-            raise CRCError("Response CRC validation failed")
+        if response[2] != 2 * count:
+            raise InvalidResponseError(
+                f"Expected {2 * count} data bytes, device reported {response[2]}"
+            )
 
-        # Return data portion only
-        return remaining[:byte_count]
+        return response[3:-2]
 
     def read_registers(self, start_address: int, count: int) -> list[int]:
         """Read holding registers from device.
@@ -288,17 +378,33 @@ class RenogyClient:
             List of register values (16-bit unsigned integers)
 
         Raises:
+            InvalidResponseError: If the byte count does not match the request
             Various exceptions from _send_request
         """
-        request = self._build_request(self.READ_HOLDING_REGISTERS, start_address, count)
-        data = self._send_request(request)
+        data = self._read_register_bytes(start_address, count)
+        # Unpack all register values (big-endian 16-bit) in one call
+        return list(struct.unpack(f">{count}H", data))
+
+    def read_registers_array(self, start_address: int, count: int) -> array.array:
+        """Read holding registers into a compact ``array.array('H')``.
 
-        # Unpack register values (big-endian 16-bit)
-        values = []
-        for i in range(0, len(data), 2):
-            value = struct.unpack(">H", data[i : i + 2])[0]
-            values.append(value)
+        Avoids one Python int object per register on large reads.
 
+        Args:
+            start_address: Starting register address
+            count: Number of registers to read
+
+        Returns:
+            Array of register values (16-bit unsigned integers)
+
+        Raises:
+            InvalidResponseError: If the byte count does not match the request
+            Various exceptions from _send_request
+        """
+        values = array.array("H", self._read_register_bytes(start_address, count))
+        # Registers arrive big-endian
+        if sys.byteorder == "little":
+            values.byteswap()
         return values
 
     def write_register(self, address: int, value: int) -> None:
@@ -311,50 +417,80 @@ class RenogyClient:
         Raises:
             Various exceptions from _send_request
         """
-        frame = struct.pack(
-            ">BBHH",
-            self.device_id,
-            self.WRITE_SINGLE_REGISTER,
-            address,
-            value,
-        )
-        crc = calculate_crc16(frame)
-        frame += struct.pack("<H", crc)
-
-        self._send_request(frame)
+        request = self._build_request(self.WRITE_SINGLE_REGISTER, address, value)
+        # A successful single-register write echoes the request frame
+        self._send_request(request, len(request))
         logger.info(f"Wrote {value} to register 0x{address:04X}")
 
+    def read_register_values(
+        self, registers: Mapping[str, RegisterDefinition] | None = None
+    ) -> dict[str, int | float | str]:
+        """Read a group of registers and decode them by name.
+
+        Contiguous registers are coalesced, so the group is fetched with as
+        few requests as possible.
+
+        Args:
+            registers: Dictionary of register definitions (default: all
+                registers from 0x0100 to 0x0117, fetched with a single read)
+
+        Returns:
+            Dictionary of register name to scaled value (or text for text registers)
+
+        Raises:
+            Various exceptions from _send_request
+        """
+        plan = LIVE_AND_STATS_READ_PLAN if registers is None else build_read_plan(registers)
+        values: dict[str, int | float | str] = {}
+        for start, count, steps, text_steps in plan:
+            data = self._read_register_bytes(start, count)
+            values.update(decode_registers(steps, data, text_steps))
+        return values
+
     def read_device_info(self) -> DeviceInfo:
         """Read device identification information.
 
+        Model, versions and serial number sit in one contiguous block
+        (0x000C-0x001F), so they are fetched with a single request.
+
         Returns:
             DeviceInfo with model, serial number, and versions
         """
         info = DeviceInfo()
 
+        # Raw big-endian bytes per field, sliced straight out of the response
+        fields: dict[str, bytes] = {}
         try:
-            # Read device model/SKU (8 registers = 16 chars at 0x000C)
-            model_data = self.read_registers(0x000C, 8)
-            model_bytes = b"".join(struct.pack(">H", v) for v in model_data)
-            info.model = model_bytes.decode("ascii", errors="ignore").strip("\x00").strip()
+            for start, count in DEVICE_INFO_BLOCKS:
+                data = self._read_register_bytes(start, count)
+                for name, reg in DEVICE_INFO_REGISTERS.items():
+                    if start <= reg.address and reg.address + reg.length <= start + count:
+                        offset = 2 * (reg.address - start)
+                        fields[name] = data[offset : offset + 2 * reg.length]
+        except ModbusError as e:
+            # Some firmware may reject the wide read; fall back to one read per field
+            logger.debug(f"Device info block read rejected ({e}), reading fields separately")
+            for name, reg in DEVICE_INFO_REGISTERS.items():
+                try:
+                    fields[name] = self._read_register_bytes(reg.address, reg.length)
+                except Exception as e:
+                    logger.warning(f"Failed to read {reg.description}: {e}")
         except Exception as e:
-            logger.warning(f"Failed to read device model: {e}")
-
-        try:
-            # Read serial number (8 registers at 0x0018)
-            serial_data = self.read_registers(0x0018, 8)
-            serial_bytes = b"".join(struct.pack(">H", v) for v in serial_data)
-            info.serial_number = serial_bytes.decode("ascii", errors="ignore").strip("\x00").strip()
-        except Exception as e:
-            logger.warning(f"Failed to read serial number: {e}")
-
-        try:
-            # Read hardware/software versions
-            version_data = self.read_registers(0x0014, 4)
-            info.hardware_version = f"V{version_data[0] >> 8}.{version_data[0] & 0xFF}"
-            info.software_version = f"V{version_data[2] >> 8}.{version_data[2] & 0xFF}"
-        except Exception as e:
-            logger.warning(f"Failed to read versions: {e}")
+            logger.warning(f"Failed to read device info: {e}")
+            self._device_info = info
+            return info
+
+        # Model/SKU and serial number are 8 registers = 16 ASCII chars each
+        if "device_model" in fields:
+            info.model = decode_ascii(fields["device_model"])
+        if "serial_number" in fields:
+            info.serial_number = decode_ascii(fields["serial_number"])
+
+        # Versions: high byte = major, low byte = minor of the first register
+        if "hardware_version" in fields:
+            info.hardware_version = decode_version(fields["hardware_version"])
+        if "software_version" in fields:
+            info.software_version = decode_version(fields["software_version"])
 
         self._device_info = info
         return info
@@ -369,43 +505,49 @@ class RenogyClient:
 
         # Read main data block (registers 0x0100-0x010A, 11 registers)
         try:
-            data = self.read_registers(0x0100, 11)
+            (
+                soc,
+                battery_voltage,
+                battery_current,
+                controller_temp,
+                battery_temp,
+                load_voltage,
+                load_current,
+                load_power,
+                solar_voltage,
+                solar_current,
+                solar_power,
+                load_state,
+            ) = _REALTIME_STRUCT.unpack(self._read_register_bytes(0x0100, 11))
 
             # Battery data
-            reading.battery.state_of_charge = data[0]
-            reading.battery.voltage = data[1] * 0.1
-            reading.battery.current = data[2] * 0.01
-
-            # Temperatures (0x0103: high byte = controller, low byte = battery)
-            temp_reg = data[3]
-            controller_temp = (temp_reg >> 8) & 0xFF
-            battery_temp = temp_reg & 0xFF
-            # Handle signed temperatures
-            if controller_temp > 127:
-                controller_temp -= 256
-            if battery_temp > 127:
-                battery_temp -= 256
+            reading.battery.state_of_charge = soc
+            reading.battery.voltage = battery_voltage * 0.1
+            reading.battery.current = battery_current * 0.01
+
+            # Temperatures (0x0103: high byte = controller, low byte = battery),
+            # already sign-extended by the struct format
             reading.controller.temperature = controller_temp
             reading.battery.temperature = battery_temp
 
             # Load data
-            reading.load.voltage = data[4] * 0.1
-            reading.load.current = data[5] * 0.01
-            reading.load.power = data[6]
+            reading.load.voltage = load_voltage * 0.1
+            reading.load.current = load_current * 0.01
+            reading.load.power = load_power
 
             # Solar data
-            reading.solar.voltage = data[7] * 0.1
-            reading.solar.current = data[8] * 0.01
-            reading.solar.power = data[9]
+            reading.solar.voltage = solar_voltage * 0.1
+            reading.solar.current = solar_current * 0.01
+            reading.solar.power = solar_power
 
             # Load switch state
-            reading.load.is_on = data[10] == 1
+            reading.load.is_on = load_state == 1
 
         except Exception as e:
             logger.error(f"Failed to read realtime data: {e}")
             raise
 
-        # Get cached device info or read it
+        # Attach cached device info, if it has been read
         if self._device_info:
             reading.device_info = self._device_info
 
@@ -420,15 +562,11 @@ class RenogyClient:
         Returns:
             Complete RenogyReading with all data
         """
+        # Device info is read once per client; read_realtime_data attaches the cached copy
         if include_device_info and not self._device_info:
             self.read_device_info()
 
-        reading = self.read_realtime_data()
-
-        if self._device_info:
-            reading.device_info = self._device_info
-
-        return reading
+        return self.read_realtime_data()
 
     def set_load(self, on: bool) -> None:
         """Turn load output on or off.
@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from .registers import CHARGING_STATUS
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceInfo:
     """Device identification and version information."""
 
@@ -18,7 +20,7 @@ class DeviceInfo:
         return f"{self.model} (S/N: {self.serial_number})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryData:
     """Battery status and measurements."""
 
@@ -36,7 +38,7 @@ class BatteryData:
         return f"Battery: {self.state_of_charge}% @ {self.voltage:.1f}V, {self.current:.2f}A"
 
 
-@dataclass
+@dataclass(slots=True)
 class SolarData:
     """Solar panel measurements."""
 
@@ -48,7 +50,7 @@ class SolarData:
         return f"Solar: {self.voltage:.1f}V, {self.current:.2f}A, {self.power}W"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadData:
     """Load output measurements."""
 
@@ -62,7 +64,7 @@ class LoadData:
         return f"Load ({state}): {self.voltage:.1f}V, {self.current:.2f}A, {self.power}W"
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerData:
     """Controller status and measurements."""
 
@@ -72,14 +74,17 @@ class ControllerData:
     @property
     def charging_status_text(self) -> str:
         """Get human-readable charging status."""
-        from .registers import CHARGING_STATUS
-        return CHARGING_STATUS.get(self.charging_status, f"Unknown ({self.charging_status})")
+        # Format the fallback only for unknown codes, not on every lookup
+        text = CHARGING_STATUS.get(self.charging_status)
+        if text is None:
+            return f"Unknown ({self.charging_status})"
+        return text
 
     def __str__(self) -> str:
         return f"Controller: {self.temperature}°C, {self.charging_status_text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily statistics."""
 
@@ -95,7 +100,7 @@ class DailyStats:
     power_consumption: int = 0     # Wh
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoricalStats:
     """Historical/cumulative statistics."""
 
@@ -108,7 +113,7 @@ class HistoricalStats:
     total_power_consumed: int = 0     # kWh
 
 
-@dataclass
+@dataclass(slots=True)
 class RenogyReading:
     """Complete reading from a Renogy device."""
 
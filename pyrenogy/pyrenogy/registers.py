@@ -10,9 +10,13 @@ Source files:
     - ModBusUtils.java: CRC calculation and hex parsing
 """
 
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Callable
+from types import MappingProxyType
+
+# Modbus limits a single function 0x03 read to 125 registers
+MAX_READ_REGISTERS = 125
 
 
 class RegisterType(IntEnum):
@@ -23,7 +27,16 @@ class RegisterType(IntEnum):
     DISCRETE = 0x02 # Read discrete inputs
 
 
-@dataclass
+class RegisterKind(IntEnum):
+    """How a register's raw bytes are interpreted."""
+    NUMERIC = 0    # Integer (width from length, sign from signed), then scaled
+    ASCII = 1      # NUL-padded ASCII text, two characters per register
+    VERSION = 2    # "V<major>.<minor>" from the high and low byte of the first register
+    HIGH_BYTE = 3  # Integer in the high byte of a single register
+    LOW_BYTE = 4   # Integer in the low byte of a single register
+
+
+@dataclass(slots=True, frozen=True)
 class RegisterDefinition:
     """Definition of a single register or register group."""
     address: int
@@ -34,34 +47,38 @@ class RegisterDefinition:
     unit: str = ""
     signed: bool = False
     register_type: RegisterType = RegisterType.HOLDING
-    decoder: Callable[[bytes], any] | None = None
+    kind: RegisterKind = RegisterKind.NUMERIC
 
 
 # Device Information Registers
-DEVICE_INFO_REGISTERS = {
+DEVICE_INFO_REGISTERS: Mapping[str, RegisterDefinition] = {
     "device_model": RegisterDefinition(
         address=0x000C,
         name="device_model",
         description="Device Model/SKU",
         length=8,  # 16 ASCII characters
+        kind=RegisterKind.ASCII,
     ),
     "serial_number": RegisterDefinition(
         address=0x0018,
         name="serial_number",
         description="Device Serial Number",
         length=8,  # 16 ASCII characters
+        kind=RegisterKind.ASCII,
     ),
     "hardware_version": RegisterDefinition(
         address=0x0014,
         name="hardware_version",
         description="Hardware Version",
         length=2,
+        kind=RegisterKind.VERSION,
     ),
     "software_version": RegisterDefinition(
         address=0x0016,
         name="software_version",
         description="Software Version",
         length=2,
+        kind=RegisterKind.VERSION,
     ),
 }
 
@@ -69,7 +86,7 @@ DEVICE_INFO_REGISTERS = {
 # Solar Charge Controller Registers (base 0x0100)
 # Source: k4/d.java - "controller_read_00_22_command" -> "0301000023"
 # Source: BleCtrlActivity.java:449-522 - response parsing
-SCC_REGISTERS = {
+SCC_REGISTERS: Mapping[str, RegisterDefinition] = {
     # Battery registers
     # Source: BleCtrlActivity.java:450-452 - hexRsp.substring(6, 10) for SOC
     "battery_soc": RegisterDefinition(
@@ -94,12 +111,22 @@ SCC_REGISTERS = {
         scale=0.01,  # Source: BleCtrlActivity.java:457
         unit="A",
     ),
-    "temperatures": RegisterDefinition(
+    # Register 0x0103 packs two signed temperatures, one per byte
+    "controller_temperature": RegisterDefinition(
+        address=0x0103,
+        name="controller_temperature",
+        description="Controller Temperature",
+        signed=True,
+        unit="°C",
+        kind=RegisterKind.HIGH_BYTE,
+    ),
+    "battery_temperature": RegisterDefinition(
         address=0x0103,
-        name="temperatures",
-        description="Controller and Battery Temperature",
+        name="battery_temperature",
+        description="Battery Temperature",
         signed=True,
         unit="°C",
+        kind=RegisterKind.LOW_BYTE,
     ),
     # Load registers
     "load_voltage": RegisterDefinition(
@@ -150,7 +177,7 @@ SCC_REGISTERS = {
 
 
 # Daily Statistics Registers
-DAILY_STATS_REGISTERS = {
+DAILY_STATS_REGISTERS: Mapping[str, RegisterDefinition] = {
     "daily_min_battery_voltage": RegisterDefinition(
         address=0x010B,
         name="daily_min_battery_voltage",
@@ -219,7 +246,7 @@ DAILY_STATS_REGISTERS = {
 
 
 # Historical Statistics Registers
-HISTORICAL_STATS_REGISTERS = {
+HISTORICAL_STATS_REGISTERS: Mapping[str, RegisterDefinition] = {
     "total_operating_days": RegisterDefinition(
         address=0x0115,
         name="total_operating_days",
@@ -240,7 +267,7 @@ HISTORICAL_STATS_REGISTERS = {
 
 
 # Control Registers
-CONTROL_REGISTERS = {
+CONTROL_REGISTERS: Mapping[str, RegisterDefinition] = {
     "load_switch": RegisterDefinition(
         address=0x010A,
         name="load_switch",
@@ -273,17 +300,40 @@ BATTERY_TYPES = {
 }
 
 
-def get_all_realtime_registers() -> dict[str, RegisterDefinition]:
-    """Get all real-time monitoring registers."""
-    return {**SCC_REGISTERS}
+# Register groups are read-only so they can be shared without defensive copies
+DEVICE_INFO_REGISTERS = MappingProxyType(DEVICE_INFO_REGISTERS)
+SCC_REGISTERS = MappingProxyType(SCC_REGISTERS)
+DAILY_STATS_REGISTERS = MappingProxyType(DAILY_STATS_REGISTERS)
+HISTORICAL_STATS_REGISTERS = MappingProxyType(HISTORICAL_STATS_REGISTERS)
+CONTROL_REGISTERS = MappingProxyType(CONTROL_REGISTERS)
+
 
+# Everything from 0x0100 to 0x0117 (live data, load switch, daily and historical
+# statistics) is contiguous and can be fetched with a single read. This is a
+# superset of get_all_realtime_registers(), which covers the live data only
+LIVE_AND_STATS_REGISTERS = MappingProxyType({
+    **SCC_REGISTERS,
+    **CONTROL_REGISTERS,
+    **DAILY_STATS_REGISTERS,
+    **HISTORICAL_STATS_REGISTERS,
+})
 
-def get_all_device_info_registers() -> dict[str, RegisterDefinition]:
+
+def get_all_realtime_registers() -> Mapping[str, RegisterDefinition]:
+    """Get the live monitoring registers (0x0100-0x0109).
+
+    The load switch and daily/historical statistics are not included; see
+    LIVE_AND_STATS_REGISTERS for the whole 0x0100-0x0117 span.
+    """
+    return SCC_REGISTERS
+
+
+def get_all_device_info_registers() -> Mapping[str, RegisterDefinition]:
     """Get all device information registers."""
-    return {**DEVICE_INFO_REGISTERS}
+    return DEVICE_INFO_REGISTERS
 
 
-def get_register_range(registers: dict[str, RegisterDefinition]) -> tuple[int, int]:
+def get_register_range(registers: Mapping[str, RegisterDefinition]) -> tuple[int, int]:
     """Get the start address and total length for a group of registers.
 
     Args:
@@ -295,8 +345,172 @@ def get_register_range(registers: dict[str, RegisterDefinition]) -> tuple[int, i
     if not registers:
         return (0, 0)
 
-    min_addr = min(r.address for r in registers.values())
-    max_reg = max(registers.values(), key=lambda r: r.address + r.length)
-    total_length = (max_reg.address + max_reg.length) - min_addr
+    # Single pass over the group for both bounds
+    min_addr = 0xFFFF
+    max_end = 0
+    for reg in registers.values():
+        if reg.address < min_addr:
+            min_addr = reg.address
+        end = reg.address + reg.length
+        if end > max_end:
+            max_end = end
+
+    return (min_addr, max_end - min_addr)
+
+
+def get_register_blocks(
+    registers: Mapping[str, RegisterDefinition],
+    max_count: int = MAX_READ_REGISTERS,
+    max_gap: int = 0,
+) -> list[tuple[int, int]]:
+    """Coalesce a group of registers into as few contiguous reads as possible.
+
+    Args:
+        registers: Dictionary of register definitions
+        max_count: Maximum number of registers per read
+        max_gap: Number of unused registers allowed between two definitions
+            before they are split into separate reads
+
+    Returns:
+        List of (start_address, count) tuples in address order
+    """
+    blocks: list[tuple[int, int]] = []
+    for reg in sorted(registers.values(), key=lambda r: r.address):
+        end = reg.address + reg.length
+        if blocks:
+            start, count = blocks[-1]
+            if reg.address <= start + count + max_gap and end - start <= max_count:
+                blocks[-1] = (start, max(count, end - start))
+                continue
+        blocks.append((reg.address, reg.length))
+    return blocks
+
+
+def _decode_unsigned(data: bytes) -> int:
+    """Decode big-endian register bytes as an unsigned integer."""
+    return int.from_bytes(data, "big")
+
+
+def _decode_signed(data: bytes) -> int:
+    """Decode big-endian register bytes as a two's complement integer."""
+    return int.from_bytes(data, "big", signed=True)
+
+
+def decode_ascii(data: bytes) -> str:
+    """Decode register bytes as a NUL-padded ASCII string."""
+    return data.decode("ascii", errors="ignore").strip("\x00").strip()
+
+
+def decode_version(data: bytes) -> str:
+    """Decode register bytes as a version: high byte = major, low byte = minor."""
+    return f"V{data[0]}.{data[1]}"
+
+
+# Numeric decoders keyed by (length in registers, signed). Any other width is
+# rejected when a read plan is built rather than decoded as an arbitrary integer
+Decoder = Callable[[bytes], int]
+_DECODERS: dict[tuple[int, bool], Decoder] = {
+    (1, False): _decode_unsigned,
+    (1, True): _decode_signed,
+    (2, False): _decode_unsigned,
+    (2, True): _decode_signed,
+}
+
+# Text decoders keyed by register kind; these values are never scaled
+TextDecoder = Callable[[bytes], str]
+_TEXT_DECODERS: dict[RegisterKind, TextDecoder] = {
+    RegisterKind.ASCII: decode_ascii,
+    RegisterKind.VERSION: decode_version,
+}
+
+
+def get_decoder(reg: RegisterDefinition) -> Decoder:
+    """Get the raw-bytes decoder for a numeric register definition.
+
+    Raises:
+        ValueError: If no numeric decoder handles the register's length
+    """
+    try:
+        return _DECODERS[(reg.length, reg.signed)]
+    except KeyError:
+        raise ValueError(
+            f"No numeric decoder for {reg.name} ({reg.length} registers)"
+        ) from None
+
+
+# One numeric decode step: (name, byte offset into the block, byte length, scale, decoder)
+DecodeStep = tuple[str, int, int, float, Decoder]
+# One text decode step: (name, byte offset into the block, byte length, decoder)
+TextDecodeStep = tuple[str, int, int, TextDecoder]
+# One read: (start_address, count, numeric steps, text steps)
+ReadPlan = tuple[tuple[int, int, tuple[DecodeStep, ...], tuple[TextDecodeStep, ...]], ...]
+
+
+def build_read_plan(registers: Mapping[str, RegisterDefinition], max_gap: int = 0) -> ReadPlan:
+    """Precompute the reads and byte offsets needed to decode a register group.
+
+    Text registers get their own steps, so only numeric values are scaled.
+    Byte-packed registers are narrowed to the single byte they occupy.
+
+    Args:
+        registers: Dictionary of register definitions
+        max_gap: Passed to get_register_blocks
+
+    Returns:
+        Tuple of (start_address, count, decode_steps, text_steps) per read
+
+    Raises:
+        ValueError: If a numeric register has a length with no decoder
+    """
+    plan = []
+    ordered = sorted(registers.values(), key=lambda r: r.address)
+    for start, count in get_register_blocks(registers, max_gap=max_gap):
+        steps: list[DecodeStep] = []
+        text_steps: list[TextDecodeStep] = []
+        for reg in ordered:
+            if not (start <= reg.address and reg.address + reg.length <= start + count):
+                continue
+            offset = 2 * (reg.address - start)
+            size = 2 * reg.length
+            text_decoder = _TEXT_DECODERS.get(reg.kind)
+            if text_decoder is not None:
+                text_steps.append((reg.name, offset, size, text_decoder))
+                continue
+            # Byte-packed registers decode one byte of the register on its own
+            if reg.kind == RegisterKind.HIGH_BYTE:
+                size = 1
+            elif reg.kind == RegisterKind.LOW_BYTE:
+                offset += 1
+                size = 1
+            steps.append((reg.name, offset, size, reg.scale, get_decoder(reg)))
+        plan.append((start, count, tuple(steps), tuple(text_steps)))
+    return tuple(plan)
+
+
+def decode_registers(
+    steps: tuple[DecodeStep, ...],
+    data: bytes,
+    text_steps: tuple[TextDecodeStep, ...] = (),
+) -> dict[str, int | float | str]:
+    """Decode raw big-endian register bytes using precomputed decode steps.
+
+    Args:
+        steps: Numeric decode steps for the block, from build_read_plan
+        data: Register data bytes of the block (no Modbus header or CRC)
+        text_steps: Text decode steps for the block, from build_read_plan
+
+    Returns:
+        Dictionary of register name to scaled value (or text for text registers)
+    """
+    values: dict[str, int | float | str] = {}
+    for name, offset, size, scale, decoder in steps:
+        value = decoder(data[offset : offset + size])
+        values[name] = value if scale == 1.0 else value * scale
+    for name, offset, size, text_decoder in text_steps:
+        values[name] = text_decoder(data[offset : offset + size])
+    return values
+
 
-    return (min_addr, total_length)
+# The register groups are fixed, so their read blocks and plans are computed once
+DEVICE_INFO_BLOCKS = tuple(get_register_blocks(DEVICE_INFO_REGISTERS))
+LIVE_AND_STATS_READ_PLAN = build_read_plan(LIVE_AND_STATS_REGISTERS)
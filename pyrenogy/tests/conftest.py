@@ -0,0 +1,19 @@
+"""Shared fixtures for the pyrenogy tests."""
+
+import pytest
+
+from pyrenogy.client import RenogyClient
+
+from .fakes import DEVICE_REGISTERS, FakeSerial
+
+
+@pytest.fixture
+def fake_serial() -> FakeSerial:
+    return FakeSerial(DEVICE_REGISTERS)
+
+
+@pytest.fixture
+def client(fake_serial: FakeSerial) -> RenogyClient:
+    client = RenogyClient("fake")
+    client._serial = fake_serial
+    return client
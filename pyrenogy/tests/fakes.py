@@ -0,0 +1,102 @@
+"""Fake serial port that answers like a Renogy controller."""
+
+import threading
+import time
+
+from pyrenogy.client import calculate_crc16
+
+
+def with_crc(frame: bytes) -> bytes:
+    """Append the little-endian CRC-16/MODBUS to a frame."""
+    return frame + calculate_crc16(frame).to_bytes(2, "little")
+
+
+class FakeSerial:
+    """Stand-in for serial.Serial backed by a register map.
+
+    Read (0x03) and write (0x06) requests are answered from ``registers``.
+    Frames queued in ``responses`` are returned instead, one per request,
+    to script malformed or exception replies.
+    """
+
+    def __init__(self, registers: dict[int, int] | None = None) -> None:
+        self.registers = dict(registers or {})
+        self.responses: list[bytes] = []
+        self.requests: list[bytes] = []
+        self.flushes = 0
+        self.reads: list[int] = []
+        self.is_open = True
+        self._pending = b""
+
+    def reset_input_buffer(self) -> None:
+        self.flushes += 1
+        self._pending = b""
+
+    def write(self, data: bytes) -> int:
+        self.requests.append(data)
+        if self.responses:
+            self._pending += self.responses.pop(0)
+            return len(data)
+
+        device_id, function_code = data[0], data[1]
+        address = int.from_bytes(data[2:4], "big")
+        value = int.from_bytes(data[4:6], "big")
+        if function_code == 0x03:
+            payload = b"".join(
+                self.registers.get(a, 0).to_bytes(2, "big") for a in range(address, address + value)
+            )
+            self._pending += with_crc(bytes([device_id, 0x03, len(payload)]) + payload)
+        elif function_code == 0x06:
+            self.registers[address] = value
+            self._pending += data
+        return len(data)
+
+    def read(self, size: int) -> bytes:
+        self.reads.append(size)
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+# A controller at -5 °C with the battery at 25 °C, charging from solar
+DEVICE_REGISTERS = {
+    0x000C: 0x524E, 0x000D: 0x472D, 0x000E: 0x4354, 0x000F: 0x524C,  # "RNG-CTRL"
+    0x0010: 0x2D52, 0x0011: 0x5652, 0x0012: 0x3430,                  # "-RVR40"
+    0x0014: 0x0102,  # hardware V1.2
+    0x0016: 0x0304,  # software V3.4
+    0x0018: 0x534E, 0x0019: 0x3132, 0x001A: 0x3334,                  # "SN1234"
+    0x0100: 87,      # SOC %
+    0x0101: 132,     # battery 13.2 V
+    0x0102: 250,     # charging 2.50 A
+    0x0103: 0xFB19,  # controller -5 °C (high byte), battery 25 °C (low byte)
+    0x0104: 131,     # load 13.1 V
+    0x0105: 120,     # load 1.20 A
+    0x0106: 15,      # load 15 W
+    0x0107: 185,     # solar 18.5 V
+    0x0108: 310,     # solar 3.10 A
+    0x0109: 57,      # solar 57 W
+    0x010A: 1,       # load on
+    0x0115: 42,      # operating days
+}
+
+
+class SlowSerial(FakeSerial):
+    """FakeSerial whose writes take ``delay`` seconds and record overlapping calls."""
+
+    def __init__(self, registers: dict[int, int], delay: float) -> None:
+        super().__init__(registers)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+
+    def write(self, data: bytes) -> int:
+        with self._count_lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._count_lock:
+            self.active -= 1
+        return super().write(data)
@@ -0,0 +1,65 @@
+"""Tests for AsyncRenogyClient serialization and connection handling."""
+
+import asyncio
+
+import pytest
+import serial
+
+from pyrenogy.async_client import AsyncRenogyClient
+
+from .fakes import DEVICE_REGISTERS, FakeSerial, SlowSerial
+
+DELAY = 0.1
+
+
+@pytest.fixture
+def slow_serial() -> SlowSerial:
+    return SlowSerial(DEVICE_REGISTERS, DELAY)
+
+
+@pytest.fixture
+def async_client(slow_serial: SlowSerial) -> AsyncRenogyClient:
+    client = AsyncRenogyClient("fake")
+    client.client._serial = slow_serial
+    return client
+
+
+def test_calls_run_one_at_a_time(async_client: AsyncRenogyClient, slow_serial: SlowSerial) -> None:
+    async def main() -> list[list[int]]:
+        return await asyncio.gather(
+            *(async_client.read_registers(0x0100, 1) for _ in range(3))
+        )
+
+    results = asyncio.run(main())
+
+    assert results == [[87], [87], [87]]
+    assert len(slow_serial.requests) == 3
+    assert slow_serial.peak == 1
+
+
+def test_cancelled_call_keeps_the_port_until_its_worker_finishes(
+    async_client: AsyncRenogyClient, slow_serial: SlowSerial
+) -> None:
+    async def main() -> bool:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(async_client.get_load_state(), DELAY / 4)
+        # The cancelled call's worker is still mid-transaction here
+        return await async_client.get_load_state()
+
+    assert asyncio.run(main()) is True
+    assert len(slow_serial.requests) == 2
+    assert slow_serial.peak == 1
+
+
+def test_context_manager_connects_and_disconnects(monkeypatch: pytest.MonkeyPatch) -> None:
+    port = FakeSerial(DEVICE_REGISTERS)
+    monkeypatch.setattr(serial, "Serial", lambda **_: port)
+
+    async def main() -> None:
+        async with AsyncRenogyClient("fake") as client:
+            assert client.is_connected
+            assert (await client.read_realtime_data()).battery.state_of_charge == 87
+        assert not client.is_connected
+
+    asyncio.run(main())
+    assert not port.is_open
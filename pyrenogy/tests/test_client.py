@@ -0,0 +1,160 @@
+"""Tests for RenogyClient register access and the Modbus transport."""
+
+import pytest
+import serial
+
+from pyrenogy import client as client_module
+from pyrenogy.client import RenogyClient, verify_crc
+from pyrenogy.exceptions import CommunicationError, CRCError, ModbusError, TimeoutError
+
+from .fakes import DEVICE_REGISTERS, FakeSerial, with_crc
+
+
+def test_read_registers_array_matches_list(client: RenogyClient) -> None:
+    values = client.read_registers(0x0100, 11)
+    packed = client.read_registers_array(0x0100, 11)
+
+    assert packed.typecode == "H"
+    assert list(packed) == values
+    assert values[3] == 0xFB19
+
+
+def test_valid_frame_is_read_head_first(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    request = client._build_request(RenogyClient.READ_HOLDING_REGISTERS, 0x0100, 2)
+    response = client._send_request(request, 9)
+
+    assert fake_serial.requests == [request]
+    assert fake_serial.reads == [5, 4]
+    assert response == with_crc(bytes([0x01, 0x03, 0x04, 0x00, 87, 0x00, 132]))
+    assert verify_crc(response)
+
+
+def test_crc_residue_check_covers_the_whole_frame() -> None:
+    frame = with_crc(bytes([0x01, 0x03, 0x02, 0x00, 0x57]))
+
+    assert verify_crc(frame)
+    assert not verify_crc(frame[:-1] + bytes([frame[-1] ^ 0x01]))
+    assert not verify_crc(frame[:2])
+
+
+def test_exception_frame_raises_modbus_error(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    fake_serial.responses.append(with_crc(bytes([0x01, 0x83, 0x02])))
+
+    with pytest.raises(ModbusError) as excinfo:
+        client.read_registers(0xFFF0, 1)
+
+    # The reply ends after 5 bytes, so no read waits for a full-length frame
+    assert fake_serial.reads == [5]
+    assert excinfo.value.function_code == 0x03
+    assert excinfo.value.exception_code == 0x02
+    assert str(excinfo.value) == "Illegal Data Address"
+
+
+def test_exception_frame_with_bad_crc(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    fake_serial.responses.append(bytes([0x01, 0x83, 0x02, 0x00, 0x00]))
+
+    with pytest.raises(CRCError, match="Exception response"):
+        client.read_registers(0xFFF0, 1)
+
+
+def test_short_frame_raises_timeout(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    fake_serial.responses.append(bytes([0x01, 0x03, 0x04, 0x00]))
+
+    with pytest.raises(TimeoutError, match="Incomplete"):
+        client.read_registers(0x0100, 2)
+
+
+def test_empty_read_raises_timeout(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    fake_serial.responses.append(b"")
+
+    with pytest.raises(TimeoutError, match="No response"):
+        client.read_registers(0x0100, 2)
+
+
+def test_full_length_frame_with_bad_crc(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    fake_serial.responses.append(bytes([0x01, 0x03, 0x02, 0x00, 0x57, 0x00, 0x00]))
+
+    with pytest.raises(CRCError, match="Response CRC"):
+        client.read_registers(0x0100, 1)
+
+
+def test_write_register_accepts_the_echo(client: RenogyClient, fake_serial: FakeSerial) -> None:
+    client.set_load(False)
+
+    assert fake_serial.requests[-1] == with_crc(bytes([0x01, 0x06, 0x01, 0x0A, 0x00, 0x00]))
+    assert fake_serial.registers[0x010A] == 0
+    assert client.get_load_state() is False
+
+
+def test_input_is_flushed_only_after_a_failed_exchange(
+    client: RenogyClient, fake_serial: FakeSerial
+) -> None:
+    # A fresh connection starts with a flush
+    client.read_registers(0x0100, 1)
+    assert fake_serial.flushes == 1
+
+    # A clean exchange leaves nothing behind to discard
+    client.read_registers(0x0100, 1)
+    assert fake_serial.flushes == 1
+
+    # A failed exchange may leave late bytes, so the next request flushes first
+    fake_serial.responses.append(b"")
+    with pytest.raises(TimeoutError):
+        client.read_registers(0x0100, 1)
+    client.read_registers(0x0100, 1)
+    assert fake_serial.flushes == 2
+
+    fake_serial.responses.append(with_crc(bytes([0x01, 0x83, 0x02])))
+    with pytest.raises(ModbusError):
+        client.read_registers(0x0100, 1)
+    client.read_registers(0x0100, 1)
+    assert fake_serial.flushes == 3
+    client.read_registers(0x0100, 1)
+    assert fake_serial.flushes == 3
+
+
+def test_connect_resets_the_flush_flag(
+    client: RenogyClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client.read_registers(0x0100, 1)
+    assert client._flush_input is False
+
+    monkeypatch.setattr(serial, "Serial", lambda **_: FakeSerial(DEVICE_REGISTERS))
+    client.connect()
+
+    assert client._flush_input is True
+    client.read_registers(0x0100, 1)
+    assert client._serial.flushes == 1
+
+
+def test_requests_fail_when_not_connected() -> None:
+    with pytest.raises(CommunicationError):
+        RenogyClient("fake").read_registers(0x0100, 1)
+
+
+def test_changing_device_id_drops_cached_device_info(
+    client: RenogyClient, fake_serial: FakeSerial
+) -> None:
+    assert client.read_all().device_info.model == "RNG-CTRL-RVR40"
+
+    # A second controller on the same bus with a different model
+    client.device_id = 2
+    fake_serial.registers[0x0012] = 0x3230  # "-RVR20"
+    reading = client.read_all()
+
+    assert reading.device_info.model == "RNG-CTRL-RVR20"
+    assert all(request[0] == 2 for request in fake_serial.requests[-2:])
+
+
+def test_requests_keep_the_rtu_inter_frame_gap(
+    client: RenogyClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+
+    client.read_registers(0x0100, 1)
+    client.read_registers(0x0100, 1)
+
+    # 3.5 characters of 11 bits at 9600 baud, only before the second request
+    assert sleeps == [pytest.approx(3.5 * 11 / 9600)]
@@ -0,0 +1,60 @@
+"""Tests for the generic register decode path."""
+
+import pytest
+
+from pyrenogy.client import RenogyClient
+from pyrenogy.registers import (
+    DEVICE_INFO_REGISTERS,
+    SCC_REGISTERS,
+    RegisterDefinition,
+    build_read_plan,
+)
+
+
+def test_register_values_match_realtime_data(client: RenogyClient) -> None:
+    values = client.read_register_values()
+    reading = client.read_realtime_data()
+
+    assert values["battery_soc"] == reading.battery.state_of_charge
+    assert values["battery_voltage"] == pytest.approx(reading.battery.voltage)
+    assert values["charging_current"] == pytest.approx(reading.battery.current)
+    assert values["controller_temperature"] == reading.controller.temperature == -5
+    assert values["battery_temperature"] == reading.battery.temperature == 25
+    assert values["load_voltage"] == pytest.approx(reading.load.voltage)
+    assert values["load_current"] == pytest.approx(reading.load.current)
+    assert values["load_power"] == reading.load.power
+    assert values["solar_voltage"] == pytest.approx(reading.solar.voltage)
+    assert values["solar_current"] == pytest.approx(reading.solar.current)
+    assert values["solar_power"] == reading.solar.power
+    assert values["load_switch"] == 1
+    assert values["total_operating_days"] == 42
+
+
+def test_scc_group_reads_without_the_load_switch(client: RenogyClient) -> None:
+    values = client.read_register_values(SCC_REGISTERS)
+
+    assert set(values) == set(SCC_REGISTERS)
+    assert values["controller_temperature"] == -5
+
+
+def test_register_values_match_device_info(client: RenogyClient) -> None:
+    values = client.read_register_values(DEVICE_INFO_REGISTERS)
+    info = client.read_device_info()
+
+    assert values == {
+        "device_model": info.model,
+        "serial_number": info.serial_number,
+        "hardware_version": info.hardware_version,
+        "software_version": info.software_version,
+    }
+    assert values["hardware_version"] == "V1.2"
+    assert values["device_model"] == "RNG-CTRL-RVR40"
+
+
+def test_read_plan_rejects_numeric_widths_without_a_decoder() -> None:
+    registers = {
+        "odd": RegisterDefinition(address=0x0100, name="odd", description="Odd", length=3),
+    }
+
+    with pytest.raises(ValueError, match="odd"):
+        build_read_plan(registers)